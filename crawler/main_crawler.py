@@ -4,6 +4,7 @@ import time
 from pymongo import MongoClient
 from vnexpress_crawler import crawl_vnexpress
 from otofun_crawler import crawl_otofun
+from news_store import write_store
 
 # === CẤU HÌNH ===
 # Danh sách mục muốn lấy từ VnExpress
@@ -55,6 +56,21 @@ def save_to_json(news_list):
     except Exception as e:
         print(f"❌ [JSON] Lỗi khi lưu file: {e}")
 
+# === HÀM LƯU KHO NHỊ PHÂN (tra cứu nhanh theo id/mục/thời gian) ===
+def save_to_store(news_list):
+    """Lưu list tin tức vào file data/all_news.nsb (xem news_store.py)"""
+    if not news_list:
+        return
+
+    os.makedirs("data", exist_ok=True)
+    file_path = "data/all_news.nsb"
+
+    try:
+        total = write_store(news_list, file_path)
+        print(f"✅ [NSB] Đã xuất file: {file_path} ({total} tin)")
+    except Exception as e:
+        print(f"❌ [NSB] Lỗi khi lưu file: {e}")
+
 # === HÀM LƯU MONGODB ===
 def push_to_mongodb(news_list):
     if not HAS_MONGO or not news_list:
@@ -100,6 +116,7 @@ def run_crawler():
     
     # Ưu tiên 1: Lưu JSON ngay lập tức (Quan trọng nhất cho App)
     save_to_json(all_news_buffer)
+    save_to_store(all_news_buffer)
     
     # Ưu tiên 2: Lưu MongoDB (Nếu có)
     push_to_mongodb(all_news_buffer)
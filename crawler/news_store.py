@@ -0,0 +1,275 @@
+# news_store.py
+"""
+Kho tin nhị phân gọn (.nsb) đọc qua mmap.
+
+Bố cục file (little-endian):
+    [header 72 byte]
+    [data]        : id + JSON của từng bài, tên mục (ghi nối tiếp, append-only)
+    [categories]  : bảng mục, sắp theo tên  -> (start, count, name_off, name_len)
+    [timestamps]  : int64 micro giây (UTC) theo vị trí, tăng dần
+    [cat column]  : uint16 mã mục theo vị trí
+    [records]     : (body_off, body_len) theo vị trí
+    [id index]    : (pos, id_off, id_len) sắp theo id
+    [cat index]   : uint32 vị trí, gom theo mục rồi theo thời gian
+
+Vị trí của bài = thứ tự sau khi sắp theo timestamp, nên tra theo id, theo
+mục hay theo khoảng thời gian đều là tìm nhị phân O(log n) trực tiếp trên
+mmap: không parse cả file, chỉ đọc vài byte mỗi bước và giải mã JSON của
+đúng các bài trả về.
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+from datetime import datetime, timezone
+
+# ------------------------------------------------------------------
+# Định dạng
+# ------------------------------------------------------------------
+MAGIC = b'NSAB'
+VERSION = 1
+
+# magic, version, reserved, count, n_categories,
+# data_off, cat_table_off, ts_off, cat_col_off, rec_off, id_idx_off, cat_idx_off
+HEADER = struct.Struct('<4sHHII7Q')
+CATEGORY = struct.Struct('<IIQI')
+TIMESTAMP = struct.Struct('<q')
+CAT_CODE = struct.Struct('<H')
+RECORD = struct.Struct('<QI')
+ID_ENTRY = struct.Struct('<IQI')
+POSITION = struct.Struct('<I')
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_micros(value) -> int:
+    """Đổi timestamp (chuỗi ISO hoặc datetime) sang micro giây UTC; lỗi -> 0"""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return 0
+    if not isinstance(value, datetime):
+        return 0
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+# ------------------------------------------------------------------
+# Ghi
+# ------------------------------------------------------------------
+def write_store(news_list, path):
+    """
+    Ghi list tin ra file .nsb:
+    - Id trùng: giữ bài xuất hiện đầu tiên
+    - Ghi ra file tạm rồi os.replace để reader không thấy file dở dang
+    """
+    seen = set()
+    articles = []
+    for item in news_list:
+        article_id = str(item.get("id", ""))
+        if article_id in seen:
+            continue
+        seen.add(article_id)
+        articles.append((to_micros(item.get("timestamp")), article_id, item))
+
+    # sorted() ổn định -> bài cùng timestamp giữ thứ tự gốc
+    articles.sort(key=lambda a: a[0])
+
+    data = bytearray()
+    records, id_entries, cat_of_pos = [], [], []
+    cat_names = sorted({str(a[2].get("category") or "") for a in articles},
+                       key=lambda c: c.encode('utf-8'))
+    cat_code = {name: code for code, name in enumerate(cat_names)}
+
+    for pos, (_, article_id, item) in enumerate(articles):
+        id_bytes = article_id.encode('utf-8')
+        id_entries.append((id_bytes, pos, HEADER.size + len(data), len(id_bytes)))
+        data += id_bytes
+
+        body = json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        records.append((HEADER.size + len(data), len(body)))
+        data += body
+
+        cat_of_pos.append(cat_code[str(item.get("category") or "")])
+
+    cat_index = sorted(range(len(articles)), key=lambda p: cat_of_pos[p])
+    cat_rows, start = [], 0
+    for code, name in enumerate(cat_names):
+        name_bytes = name.encode('utf-8')
+        count = cat_of_pos.count(code)
+        cat_rows.append((start, count, HEADER.size + len(data), len(name_bytes)))
+        data += name_bytes
+        start += count
+
+    id_entries.sort(key=lambda e: e[0])
+
+    sections = []
+    offset = HEADER.size + len(data)
+    for chunk in (
+        b''.join(CATEGORY.pack(*row) for row in cat_rows),
+        b''.join(TIMESTAMP.pack(a[0]) for a in articles),
+        b''.join(CAT_CODE.pack(c) for c in cat_of_pos),
+        b''.join(RECORD.pack(*r) for r in records),
+        b''.join(ID_ENTRY.pack(*e[1:]) for e in id_entries),
+        b''.join(POSITION.pack(p) for p in cat_index),
+    ):
+        sections.append((offset, chunk))
+        offset += len(chunk)
+
+    header = HEADER.pack(MAGIC, VERSION, 0, len(articles), len(cat_names),
+                         HEADER.size, *(off for off, _ in sections))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(data)
+        for _, chunk in sections:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+    return len(articles)
+
+
+def convert_json(json_path, store_path):
+    """Chuyển all_news.json hiện có sang file .nsb"""
+    with open(json_path, "r", encoding="utf-8") as f:
+        news_list = json.load(f)
+    return write_store(news_list, store_path)
+
+
+# ------------------------------------------------------------------
+# Đọc
+# ------------------------------------------------------------------
+class NewsStore:
+    """
+    Reader cho file .nsb. Dùng như context manager:
+
+        with NewsStore("data/all_news.nsb") as store:
+            store.get("4963829")
+            store.by_category("Thoi Su")
+            store.between("2025-11-14T00:00:00", "2025-11-15T00:00:00")
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"File rỗng, không phải kho .nsb: {path}")
+
+        if len(self._mm) < HEADER.size:
+            self.close()
+            raise ValueError(f"File quá ngắn, không phải kho .nsb: {path}")
+        (magic, version, _, self._count, self._n_cat, _,
+         self._cat_off, self._ts_off, self._cat_col_off, self._rec_off,
+         self._id_off, self._cat_idx_off) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Sai định dạng kho .nsb: {path} ({magic!r} v{version})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._mm is None:
+            return
+        self._mm.close()
+        self._file.close()
+        self._mm = None
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        """Duyệt toàn bộ bài theo thứ tự thời gian"""
+        for pos in range(self._count):
+            yield self._article(pos)
+
+    # --- truy cập theo vị trí ---
+    def _timestamp(self, pos):
+        return TIMESTAMP.unpack_from(self._mm, self._ts_off + pos * TIMESTAMP.size)[0]
+
+    def _article(self, pos):
+        off, length = RECORD.unpack_from(self._mm, self._rec_off + pos * RECORD.size)
+        return json.loads(self._mm[off:off + length].decode('utf-8'))
+
+    def _category_row(self, code):
+        return CATEGORY.unpack_from(self._mm, self._cat_off + code * CATEGORY.size)
+
+    def _category_name(self, code):
+        _, _, off, length = self._category_row(code)
+        return self._mm[off:off + length]
+
+    def _cat_position(self, i):
+        return POSITION.unpack_from(self._mm, self._cat_idx_off + i * POSITION.size)[0]
+
+    # --- API ---
+    def categories(self):
+        """Danh sách mục (đã sắp theo tên)"""
+        return [self._category_name(c).decode('utf-8') for c in range(self._n_cat)]
+
+    def get(self, article_id):
+        """Tìm bài theo id; không có -> None"""
+        key = str(article_id).encode('utf-8')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            pos, off, length = ID_ENTRY.unpack_from(self._mm, self._id_off + mid * ID_ENTRY.size)
+            current = self._mm[off:off + length]
+            if current == key:
+                return self._article(pos)
+            if current < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def by_category(self, category):
+        """Toàn bộ bài của một mục, theo thứ tự thời gian"""
+        key = str(category).encode('utf-8')
+        lo, hi = 0, self._n_cat
+        while lo < hi:
+            mid = (lo + hi) // 2
+            name = self._category_name(mid)
+            if name == key:
+                start, count, _, _ = self._category_row(mid)
+                return [self._article(self._cat_position(i))
+                        for i in range(start, start + count)]
+            if name < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return []
+
+    def between(self, start=None, end=None):
+        """Các bài có start <= timestamp < end (chuỗi ISO hoặc datetime; None = không giới hạn)"""
+        first = 0 if start is None else self._lower_bound(to_micros(start))
+        last = self._count if end is None else self._lower_bound(to_micros(end))
+        return [self._article(pos) for pos in range(first, last)]
+
+    def _lower_bound(self, micros):
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._timestamp(mid) < micros:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chuyển all_news.json sang kho nhị phân .nsb")
+    parser.add_argument("json_path", nargs="?", default="data/all_news.json")
+    parser.add_argument("store_path", nargs="?", default="data/all_news.nsb")
+    args = parser.parse_args()
+
+    total = convert_json(args.json_path, args.store_path)
+    print(f"✅ [NSB] Đã chuyển {total} tin: {args.json_path} -> {args.store_path}")